@@ -17,6 +17,9 @@ class ProfileFactory(factory.django.DjangoModelFactory):
 class UserFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = CustomUser
+        # The profile is created by its own factory, so the user doesn't
+        # need saving again after the post-generation hooks run.
+        skip_postgeneration_save = True
 
     username = factory.Sequence(lambda n: "user_%d" % n)
     first_name = "Jane"
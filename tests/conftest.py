@@ -1,3 +1,22 @@
+import re
+
+import pytest
+from playwright.sync_api import BrowserContext
 from playwright.sync_api import expect
 
 expect.set_options(timeout=5_000)
+
+# Third-party requests the tests don't depend on. Blocking them keeps test
+# runs out of the site's analytics and avoids waiting on external hosts.
+BLOCKED_URLS = re.compile(
+    r"^https?://(plausible\.io|fonts\.googleapis\.com|fonts\.gstatic\.com)/"
+)
+
+
+@pytest.fixture
+def context(context: BrowserContext):
+    # Fail fast instead of waiting on Playwright's 30s defaults.
+    context.set_default_timeout(5_000)
+    context.set_default_navigation_timeout(10_000)
+    context.route(BLOCKED_URLS, lambda route: route.abort())
+    yield context